@@ -4,6 +4,9 @@ from bs4 import BeautifulSoup
 
 from settings import TrendingSettings
 
+# Letters, digits, underscore, spaces, # only
+_VALID_HASHTAG_PATTERN = re.compile(r'^[\w\s#]+$')
+
 
 async def get_trending_hashtags(limit=TrendingSettings.DEFAULT_LIMIT):
     """
@@ -27,11 +30,9 @@ async def get_trending_hashtags(limit=TrendingSettings.DEFAULT_LIMIT):
         trends = soup.select("ol.trend-card__list li span.trend-name a.trend-link")
         unique_hashtags = set()
 
-        pattern = re.compile(r'^[\w\s#]+$')  # letters, digits, underscore, spaces, # only
-
         for tag in trends[:limit]:
             tag_text = tag.get_text().strip()
-            if pattern.match(tag_text):  # Only add if matches pattern
+            if _VALID_HASHTAG_PATTERN.match(tag_text):  # Only add if matches pattern
                 unique_hashtags.add(tag_text)
 
         hashtag_list = list(unique_hashtags)
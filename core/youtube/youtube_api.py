@@ -10,6 +10,46 @@ from googleapiclient.errors import HttpError
 from settings import YouTubeSettings
 
 
+def _execute_upload(youtube: Resource, body: dict, file_path: str, file_size: int) -> dict:
+    """
+    Send the video to YouTube and return the API response.
+
+    Typical Shorts are sent in a single request. Files of at least
+    YouTubeSettings.RESUMABLE_THRESHOLD bytes use a resumable upload in large
+    chunks so that each chunk round-trip carries as many bytes as possible.
+    """
+    if file_size < YouTubeSettings.RESUMABLE_THRESHOLD:
+        # No client-side retries here: re-sending the insert after a server error can create a
+        # duplicate video, so failures are left to the single retry loop in upload_video
+        media = MediaFileUpload(file_path, mimetype="video/mp4", resumable=False)
+        return youtube.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media
+        ).execute()
+
+    media = MediaFileUpload(
+        file_path, mimetype="video/mp4", chunksize=YouTubeSettings.UPLOAD_CHUNK_SIZE, resumable=True
+    )
+    request = youtube.videos().insert(
+        part="snippet,status",
+        body=body,
+        media_body=media
+    )
+    response = None
+    last_progress = None
+    while response is None:
+        # Retrying a chunk resumes the same upload session, so it can't create a duplicate video
+        status, response = request.next_chunk(num_retries=YouTubeSettings.API_NUM_RETRIES)
+        if status:
+            # Only report progress in steps of UPLOAD_PROGRESS_STEP percent
+            progress = int(status.progress() * 100)
+            if last_progress is None or progress - last_progress >= YouTubeSettings.UPLOAD_PROGRESS_STEP:
+                print(f"Upload progress: {progress}%")
+                last_progress = progress
+    return response
+
+
 def upload_video(
     youtube: Resource,
     file_path: str,
@@ -51,16 +91,11 @@ def upload_video(
     file_size = os.path.getsize(file_path)
     print(f"Starting upload of file: {file_path} (Size: {file_size} bytes)")
 
-    # Retry logic for non-resumable upload
+    # Retry logic for the upload
     max_retries = 3
     for attempt in range(1, max_retries + 1):
         try:
-            media = MediaFileUpload(file_path, resumable=False)
-            response = youtube.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media
-            ).execute()
+            response = _execute_upload(youtube, body, file_path, file_size)
             video_id = response.get('id')
             if video_id:
                 print(f"✅ Video uploaded! Video ID: {video_id}")
@@ -2,6 +2,8 @@
 import os
 import sys
 import asyncio
+from contextlib import nullcontext
+from typing import Optional
 
 # Local imports
 from core.trends.trends_api_client import get_trending_hashtags
@@ -9,17 +11,26 @@ from services.auth import authenticate_youtube
 from services.fetch_news import fetch_news_article
 from services.shorts_uploader import upload_youtube_shorts
 from services.video_processor import create_overlay_video_output
-from settings import news_settings, PathSettings, TrendingSettings
+from settings import news_settings, PathSettings, TrendingSettings, VideoSettings, YouTubeSettings
 from utils.commons import normalize_hashtag
+from utils.web.image_cache import prefetch_images
 
 
-async def process_article(yt, category: str, article: dict, hashtag: str = None) -> None:
-    """Process a single article asynchronously."""
+async def process_article(yt, category: str, article: dict, hashtag: str = None,
+                          render_semaphore: Optional[asyncio.Semaphore] = None,
+                          upload_semaphore: Optional[asyncio.Semaphore] = None) -> None:
+    """
+    Process a single article asynchronously.
+    Rendering and uploading are bounded by separate semaphores, so the upload of a finished
+    video overlaps with rendering the next ones.
+    """
     try:
         # Create the overlay video
-        overlay_video_output = await create_overlay_video_output(category, article)
+        async with render_semaphore or nullcontext():
+            overlay_video_output = await create_overlay_video_output(category, article)
         # Upload to YouTube Shorts
-        await upload_youtube_shorts(yt, category, overlay_video_output, article, hashtag)
+        async with upload_semaphore or nullcontext():
+            await upload_youtube_shorts(yt, category, overlay_video_output, article, hashtag)
     except Exception as e:
         print(f"Error processing article: {str(e)}")
         raise
@@ -52,31 +63,30 @@ async def process_categories(yt) -> None:
         total_articles_fetched = sum(len(articles) for articles in all_category_articles.values())
         print(f"\n🔍 Total articles fetched: {total_articles_fetched} for {total_categories_articles_fetched} categories")
 
-        # Now process categories with limited concurrency (max 3 categories in parallel)
+        # Start downloading article images now, so they are ready before each article gets a render slot
+        prefetch_images(article.get("image") for articles in all_category_articles.values() for article in articles)
+
+        # Now process categories with limited rendering and upload concurrency
+        render_semaphore = asyncio.Semaphore(VideoSettings.MAX_CONCURRENT_RENDERS)
+        upload_semaphore = asyncio.Semaphore(YouTubeSettings.MAX_CONCURRENT_UPLOADS)
+
         async def process_category_articles(category, articles):
             try:
                 print(f"\n\n\n📌 Processing category: {category} with {len(articles)} articles")
 
                 # Process articles concurrently (since max 2 articles per category)
-                tasks = [process_article(yt, category, article) for article in articles]
+                tasks = [process_article(yt, category, article,
+                                         render_semaphore=render_semaphore, upload_semaphore=upload_semaphore)
+                         for article in articles]
                 await asyncio.gather(*tasks, return_exceptions=True)
 
                 print(f"✅ Successfully processed category: {category}")
             except Exception as e:
                 print(f"⚠️ Error processing category {category}: {str(e)}")
 
-        # Limit concurrent category processing to max 3 using semaphore
-        semaphore = asyncio.Semaphore(3)
-
-        async def process_category_with_semaphore(category, articles):
-            async with semaphore:
-                await process_category_articles(category, articles)
-                # Add small delay between category batches to reduce server load
-                await asyncio.sleep(1)
-
-        # Create tasks for processing categories with limited concurrency
+        # Create tasks for processing categories; rendering concurrency is limited by the semaphore
         category_tasks = [
-            process_category_with_semaphore(category, articles)
+            process_category_articles(category, articles)
             for category, articles in all_category_articles.items()
             if articles  # Skip categories with no articles
         ]
@@ -126,32 +136,31 @@ async def process_keywords(yt) -> None:
         total_articles_fetched = sum(len(articles) for query, articles in all_hashtag_articles.values())
         print(f"\n🔍 Total articles fetched: {total_articles_fetched} for {total_hashtags_articles_fetched} hashtags")
 
-        # Now process hashtags with limited concurrency (max 3 hashtags in parallel)
+        # Start downloading article images now, so they are ready before each article gets a render slot
+        prefetch_images(article.get("image") for query, articles in all_hashtag_articles.values() for article in articles)
+
+        # Now process hashtags with limited rendering and upload concurrency
+        render_semaphore = asyncio.Semaphore(VideoSettings.MAX_CONCURRENT_RENDERS)
+        upload_semaphore = asyncio.Semaphore(YouTubeSettings.MAX_CONCURRENT_UPLOADS)
+
         async def process_hashtag_articles(hashtag, query_articles_tuple):
             try:
                 query, articles = query_articles_tuple
                 print(f"\n\n\n🔍 Processing hashtag: {hashtag} with {len(articles)} articles")
 
                 # Process articles concurrently within each hashtag
-                tasks = [process_article(yt, query, article, hashtag) for article in articles]
+                tasks = [process_article(yt, query, article, hashtag,
+                                         render_semaphore=render_semaphore, upload_semaphore=upload_semaphore)
+                         for article in articles]
                 await asyncio.gather(*tasks, return_exceptions=True)
 
                 print(f"✅ Successfully processed hashtag: {hashtag}")
             except Exception as e:
                 print(f"⚠️ Error processing hashtag {hashtag}: {str(e)}")
 
-        # Limit concurrent hashtag processing to max 3 using semaphore
-        semaphore = asyncio.Semaphore(3)
-
-        async def process_hashtag_with_semaphore(hashtag, query_articles):
-            async with semaphore:
-                await process_hashtag_articles(hashtag, query_articles)
-                # Add small delay between hashtag batches to reduce server load
-                await asyncio.sleep(1)
-
-        # Create tasks for processing hashtags with limited concurrency
+        # Create tasks for processing hashtags; rendering concurrency is limited by the semaphore
         hashtag_tasks = [
-            process_hashtag_with_semaphore(hashtag, query_articles)
+            process_hashtag_articles(hashtag, query_articles)
             for hashtag, query_articles in all_hashtag_articles.items()
             if query_articles[1]  # Skip hashtags with no articles
         ]
@@ -1,9 +1,15 @@
 import os
 import pickle
+import threading
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+
+from settings import YouTubeSettings
 
 # Constants
 CLIENT_SECRETS_FILE = "client_secrets.json"
@@ -11,6 +17,24 @@ CLIENT_SECRETS_FILE = "client_secrets.json"
 SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 TOKEN_PICKLE = "token.pkl"
 
+def _thread_local_request_builder(creds):
+    """
+    Create a request builder that gives each thread its own authorized connection.
+
+    httplib2.Http is not thread-safe, and uploads run on several executor threads.
+    Each thread keeps its connection, so later requests from it reuse the open TLS session.
+    """
+    local = threading.local()
+
+    def build_request(http, *args, **kwargs):
+        if not hasattr(local, "http"):
+            local.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http(timeout=YouTubeSettings.HTTP_TIMEOUT)
+            )
+        return HttpRequest(local.http, *args, **kwargs)
+
+    return build_request
+
 def authenticate_youtube():
     """
     Authenticate with YouTube API using OAuth 2.0
@@ -34,7 +58,4 @@ def authenticate_youtube():
         with open(TOKEN_PICKLE, "wb") as token:
             pickle.dump(creds, token)
 
-    youtube = build("youtube", "v3", credentials=creds)
-    # Increase HTTP timeout for slower/resumable uploads
-    youtube._http.timeout = 300  # 5 minutes
-    return youtube
+    return build("youtube", "v3", credentials=creds, requestBuilder=_thread_local_request_builder(creds))
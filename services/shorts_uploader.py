@@ -7,6 +7,7 @@ from googleapiclient.discovery import Resource
 
 from core.youtube.youtube_api import add_to_playlist, upload_video
 from settings import YouTubeSettings
+from utils.commons import remove_files
 from utils.metadata.metadata_utils import (
     generate_video_description,
     generate_video_tags,
@@ -42,6 +43,22 @@ async def _run_in_upload_executor(func, *args, **kwargs):
     executor = get_upload_executor()
     return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
 
+def _upload_and_add_to_playlist(
+    yt: Resource,
+    file_path: str,
+    title: str,
+    description: str,
+    tags: List[str],
+    youtube_category: str,
+    privacy: str,
+    category: str
+) -> str:
+    """Upload the video and add it to the category playlist on the calling thread."""
+    video_id = upload_video(yt, file_path, title, description, tags, youtube_category, privacy)
+    if video_id:
+        add_to_playlist(yt, video_id, category)
+    return video_id
+
 async def upload_youtube_shorts(
     yt: Resource,
     category: str,
@@ -59,6 +76,8 @@ async def upload_youtube_shorts(
         article: The news article data used for tag generation
         hashtag: Optional hashtag to include in the video metadata
 
+    The video file is deleted afterwards, whether or not the upload succeeded.
+
     Raises:
         Exception: If upload fails
     """
@@ -83,24 +102,26 @@ async def upload_youtube_shorts(
         # TODO: Check in cache with title, if it exists already skip upload.
         print(f"🚀 Uploading '{category}' video to YouTube Shorts...")
 
-        # Run the upload operation in the executor (network-bound but potentially slow)
+        # Run the upload and the playlist addition as one executor job (network-bound but potentially slow);
+        # staying on the same thread lets the playlist insert reuse the upload's open connection
         video_id = await _run_in_upload_executor(
-            upload_video,
+            _upload_and_add_to_playlist,
             yt,
             overlay_video_output,
             title,
             description,
             combined_tags[:YouTubeSettings.MAX_TAGS],
             youtube_category,
-            privacy
+            privacy,
+            category
         )
-
-        # Also run the playlist addition in the executor
         if video_id:
-            await _run_in_upload_executor(add_to_playlist, yt, video_id, category)
             print(f"✅ Successfully uploaded video for {category} and added to playlist")
 
         return video_id
     except Exception as e:
         print(f"❌ Error uploading YouTube Short for {category}: {str(e)}")
         raise
+    finally:
+        # Every article renders to its own file, so remove it once the upload is done either way
+        await _run_in_upload_executor(remove_files, overlay_video_output)
@@ -1,17 +1,19 @@
 from pathlib import Path
 import asyncio
+import hashlib
+import os
+import stat
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import functools
 
-from moviepy.audio.io.AudioFileClip import AudioFileClip
-from moviepy.video.VideoClip import ImageClip
-
-from settings import PathSettings, VideoSettings, news_settings
+from settings import PathSettings, news_settings
 from utils.media.audio_composer import AudioComposer
+from utils.media.ffmpeg_utils import get_audio_duration
 from utils.media.video_composer import VideoComposer
 from utils.web.browser_utils import render_card_to_image
 from utils.web.html_utils import create_html_card
+from utils.commons import remove_files
 from utils.file_lock import FileLock
 
 # Shared thread pool executor with proper initialization
@@ -43,12 +45,22 @@ async def _run_in_executor(func, *args, **kwargs):
     executor = get_executor()
     return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
 
-async def _generate_overlay_image(category: str, article: dict) -> str:
+def _validate_files(*paths: str) -> None:
+    """Check that every path is a non-empty regular file, with a single stat call per path."""
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Required file not found: {path}") from None
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            raise FileNotFoundError(f"Required file is missing or empty: {path}")
+
+async def _generate_overlay_image(category: str, article: dict, article_key: str) -> str:
     """Generate the overlay image asynchronously using the shared executor."""
     try:
-        # Get file paths
-        html_output = PathSettings.get_html_output(category)
-        overlay_image = PathSettings.get_overlay_image(category)
+        # Get file paths; they are per article, so the card stays in place until its video is rendered
+        html_output = PathSettings.get_html_output(category, article_key)
+        overlay_image = PathSettings.get_overlay_image(category, article_key)
 
         # Acquire locks for both files
         await FileLock.acquire(html_output)
@@ -73,14 +85,15 @@ async def _generate_overlay_image(category: str, article: dict) -> str:
 async def create_overlay_video_output(category: str, article: dict) -> str:
     """Create an overlay video asynchronously using the shared executor."""
     try:
-        # Get file paths that need locking
-        output_video_path = PathSettings.get_final_video(category)
+        # Get file paths that need locking; each article gets its own card and video, so neither is
+        # overwritten by another article in the same category before it has been rendered and uploaded
+        article_key = hashlib.md5(
+            (article.get('url') or article.get('title') or '').encode('utf-8')
+        ).hexdigest()[:12]
+        output_video_path = PathSettings.get_final_video(category, article_key)
         await FileLock.acquire(output_video_path)
 
         try:
-            # Generate the overlay image
-            overlay_image = await _generate_overlay_image(category, article)
-
             # Get background assets
             bg_image = PathSettings.get_image_path(
                 news_settings.category_bg_image.get(category, news_settings.category_bg_image["default"])
@@ -91,58 +104,46 @@ async def create_overlay_video_output(category: str, article: dict) -> str:
             print(f"📸 Using background image: {bg_image}")
             print(f"🎵 Using background music: {bg_music}")
 
-            # Validate input files
-            for path in [bg_image, bg_music, overlay_image]:
-                if not await _run_in_executor(Path(path).is_file):
-                    raise FileNotFoundError(f"Required file not found: {path}")
+            # Validate background assets before starting any expensive work, in a single executor hop
+            await _run_in_executor(_validate_files, bg_image, bg_music)
 
             # Ensure output directory exists
             await _run_in_executor(lambda: Path(output_video_path).parent.mkdir(parents=True, exist_ok=True))
 
-            # Generate article audio
-            print("🎙️ Generating audio from article...")
-            speech_audio = await AudioComposer.generate_article_audio(article)
-            duration = speech_audio.duration
-
-            # Load audio and image files in executor
-            bg_audio_clip = await _run_in_executor(AudioFileClip, bg_music)
             try:
-                # Configure & Create composite audio
-                combined_audio = await AudioComposer.create_composite_audio(
-                    speech_audio, bg_audio_clip, duration
+                # Render the overlay card and synthesize the article audio concurrently;
+                # they are independent and mostly I/O-bound
+                print("🎙️ Generating audio from article...")
+                results = await asyncio.gather(
+                    _generate_overlay_image(category, article, article_key),
+                    AudioComposer.generate_article_audio(article),
+                    return_exceptions=True
                 )
-                print("✅ Audio generated and combined successfully")
-
-                # Load image clips in executor
-                bg_clip = await _run_in_executor(ImageClip, bg_image)
-                overlay_clip = await _run_in_executor(ImageClip, overlay_image)
-
-                try:
-                    # Create composite video
-                    composite_video = await _run_in_executor(
-                        VideoComposer.create_composite_video,
-                        bg_clip, overlay_clip, combined_audio, duration
-                    )
-
-                    # Write video file in executor (this is CPU intensive)
-                    await _run_in_executor(
-                        composite_video.write_videofile,
-                        output_video_path,
-                        fps=VideoSettings.FPS,
-                        codec=VideoSettings.VIDEO_CODEC,
-                        audio_codec=VideoSettings.AUDIO_CODEC,
-                        logger=None
-                    )
-                finally:
-                    # Clean up resources
-                    await _run_in_executor(lambda: bg_clip.close() if hasattr(bg_clip, 'close') else None)
-                    await _run_in_executor(lambda: overlay_clip.close() if hasattr(overlay_clip, 'close') else None)
-                    if hasattr(composite_video, 'close'):
-                        await _run_in_executor(composite_video.close)
+                errors = [result for result in results if isinstance(result, BaseException)]
+                if errors:
+                    raise errors[0]
+                overlay_image, speech_audio = results
+
+                await _run_in_executor(_validate_files, overlay_image)
+
+                duration = await _run_in_executor(get_audio_duration, speech_audio)
+
+                # Render the video and mix the speech with the background music in one ffmpeg run (this is CPU intensive)
+                await _run_in_executor(
+                    VideoComposer.render_video,
+                    bg_image, overlay_image, speech_audio, bg_music, output_video_path, duration
+                )
+            except Exception:
+                # Don't leave a partially written video behind
+                await _run_in_executor(remove_files, output_video_path)
+                raise
             finally:
-                # Safely close background audio clip if available
-                if hasattr(bg_audio_clip, 'close') and bg_audio_clip is not None:
-                    await _run_in_executor(bg_audio_clip.close)
+                # The card is part of the video now (or the render failed), so it is no longer needed
+                await _run_in_executor(
+                    remove_files,
+                    PathSettings.get_html_output(category, article_key),
+                    PathSettings.get_overlay_image(category, article_key)
+                )
 
             print(f"✅ Overlay Video created successfully: {output_video_path}")
             return output_video_path
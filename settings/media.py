@@ -6,22 +6,49 @@ class VideoSettings:
     IMAGE_VERTICAL_OFFSET = 300
     VIDEO_CODEC = "libx264"
     AUDIO_CODEC = "aac"
+    PIXEL_FORMAT = "yuv420p"
     FPS = 24
+    FRAME_SIZE = "1080x1920"  # Size of the background images, and so of the rendered Shorts
+    MAX_CONCURRENT_RENDERS = 3
+    # The output is a still image with an overlay, so favour encode speed over file size
+    FFMPEG_PRESET = "ultrafast"
+    FFMPEG_TUNE = "stillimage"
+
+    # Hardware H.264 encoders tried in order before falling back to VIDEO_CODEC
+    HW_VIDEO_CODECS = {
+        "h264_nvenc": {"preset": "p1", "ffmpeg_params": ["-rc", "vbr", "-cq", "28"]},
+        "h264_videotoolbox": {"preset": "medium", "ffmpeg_params": ["-realtime", "1"]},
+        "h264_qsv": {"preset": "veryfast", "ffmpeg_params": []},
+    }
 
 class BrowserSettings:
     WINDOW_WIDTH = HTMLSettings.CARD_WIDTH
     WINDOW_HEIGHT = 820
-    BROWSER_WAIT_TIME = 2  # seconds
+    BROWSER_WAIT_TIME = 2  # seconds; maximum wait for the card page to finish loading
+    POOL_SIZE = VideoSettings.MAX_CONCURRENT_RENDERS  # One browser per concurrent render
+    IMAGE_DOWNLOAD_TIMEOUT = 5  # seconds; per connect/read
+    IMAGE_DOWNLOAD_DEADLINE = 5  # seconds; overall time a card waits for its image before using the remote URL
+    IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    IMAGE_DOWNLOAD_RETRIES = 2  # Retries for failed connections to the image host
+    IMAGE_DOWNLOAD_POOL_SIZE = 10  # Keep-alive connections kept per image host
+    IMAGE_PREFETCH_WORKERS = 8  # Article images downloaded in the background at once
 
 class AudioSettings:
     NORMALIZATION_FACTOR = 2**15  # Factor to normalize audio samples to [-1, 1]
     SPEECH_VOLUME = 1.0
     BACKGROUND_MUSIC_VOLUME = 0.15
+    OUTPUT_SAMPLE_RATE = 44100  # Sample rate of the mixed audio in the final video
 
     # AWS Polly voice settings
     DEFAULT_VOICE_ID = "Joanna"
     DEFAULT_ENGINE = "neural"
     DEFAULT_TEXT_TYPE = "ssml"
+    SPEECH_SAMPLE_RATE = 24000  # Polly neural mp3 rate; its PCM output tops out at 16 kHz
+    STREAM_CHUNK_SIZE = 64 * 1024  # Block size when streaming Polly audio to disk
+
+    # Long SSML is split into chunks below Polly's per-request limit and synthesized concurrently
+    SSML_CHUNK_MAX_CHARS = 2800
+    MAX_SYNTHESIS_WORKERS = 4
 
     # SSML settings
     PROSODY_RATE = "100%"
@@ -8,15 +8,16 @@ class PathSettings:
     ASSETS_IMAGE_DIR = f"{ASSETS_DIR}/images"
     HTML_CARD_DIR = f"{OUTPUT_DIR}/intermediate/html_card"
     NEWS_CARDS_DIR = f"{OUTPUT_DIR}/intermediate/news_card"
+    ARTICLE_IMAGE_DIR = f"{OUTPUT_DIR}/article_images"
 
     # File path helper methods
     @staticmethod
-    def get_html_output(category: str) -> str:
-        return f"{PathSettings.HTML_CARD_DIR}/temp_{category}.html"
+    def get_html_output(category: str, article_key: str) -> str:
+        return f"{PathSettings.HTML_CARD_DIR}/temp_{category}_{article_key}.html"
 
     @staticmethod
-    def get_overlay_image(category: str) -> str:
-        return f"{PathSettings.NEWS_CARDS_DIR}/card_{category}.png"
+    def get_overlay_image(category: str, article_key: str) -> str:
+        return f"{PathSettings.NEWS_CARDS_DIR}/card_{category}_{article_key}.png"
 
     @staticmethod
     def get_video_path(bgm_video: str) -> str:
@@ -31,5 +32,5 @@ class PathSettings:
         return f"{PathSettings.ASSETS_IMAGE_DIR}/{bg_image}.png"
 
     @staticmethod
-    def get_final_video(category: str) -> str:
-        return f"{PathSettings.OUTPUT_DIR}/short_with_overlay_{category}.mp4"
+    def get_final_video(category: str, article_key: str) -> str:
+        return f"{PathSettings.OUTPUT_DIR}/short_with_overlay_{category}_{article_key}.mp4"
@@ -3,6 +3,14 @@ class YouTubeSettings:
     ARTICLE_MAX_TAGS = 3
     MAX_TAGS = 9
 
+    # Upload Settings
+    RESUMABLE_THRESHOLD = 64 * 1024 * 1024   # Files at least this large use a resumable upload
+    UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024     # Chunk size for resumable uploads
+    UPLOAD_PROGRESS_STEP = 5                 # Percent between upload progress messages
+    API_NUM_RETRIES = 5                      # Client-side retries of resumable upload chunks on 5xx/429 responses
+    MAX_CONCURRENT_UPLOADS = 3               # Bounded to avoid write timeouts from parallel uploads
+    HTTP_TIMEOUT = 300                       # Seconds; generous for slower/resumable uploads
+
     # Default HashTags
     DEFAULT_HASHTAGS = ["TrendingNow", "CurrentAffairs"]
     EXTRA_DESCRIPTION_HASHTAGS = ["shorts"]
@@ -1,6 +1,18 @@
+import os
 import re
 from datetime import datetime, timedelta, timezone
 
+# Words of a Pascal-Case hashtag, compiled once instead of on every normalize_hashtag call
+_HASHTAG_WORD_PATTERN = re.compile(
+    r'''
+        [A-Z]{3,}(?=[A-Z][a-z])  # acronyms (≥3 letters) before a Pascal-Case word
+        | [A-Z][a-z]+            # Pascal-Case words
+        | [A-Z]{3,}              # standalone acronyms (≥3 letters)
+        | [A-Z]{2,}              # standalone acronyms (≥2 letters)
+        ''',
+    re.VERBOSE
+)
+
 def get_zulu_time_minus(minutes: int = 15) -> str:
     """
     Returns the UTC (Zulu) time string for 'minutes' ago from now.
@@ -34,14 +46,18 @@ def normalize_hashtag(text: str) -> str:
         str: Normalized text with words of length > 1.
     """
     text = text.lstrip("#")
-    pattern = re.compile(
-        r'''
-            [A-Z]{3,}(?=[A-Z][a-z])  # acronyms (≥3 letters) before a Pascal-Case word
-            | [A-Z][a-z]+            # Pascal-Case words
-            | [A-Z]{3,}              # standalone acronyms (≥3 letters)
-            | [A-Z]{2,}              # standalone acronyms (≥2 letters)
-            ''',
-        re.VERBOSE
-    )
-    words = pattern.findall(text)
+    words = _HASHTAG_WORD_PATTERN.findall(text)
     return " ".join(words) or text
+
+def remove_files(*paths: str) -> None:
+    """
+    Delete the given files, skipping any that don't exist.
+
+    Args:
+        *paths (str): Paths of the files to delete
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -5,8 +5,6 @@ import asyncio
 import functools
 from concurrent.futures import ThreadPoolExecutor
 
-from moviepy.audio.AudioClip import AudioArrayClip, CompositeAudioClip
-
 from settings import AudioSettings, PathSettings
 from utils.media.audio_utils import convert_text_to_speech
 from utils.media.ssml_text_generator import TextProcessor
@@ -41,82 +39,55 @@ async def _run_in_audio_executor(func, *args, **kwargs):
 class AudioComposer:
     """Handles audio generation and composition."""
 
-    # Simple cache to avoid regenerating the same audio
-    _audio_cache = {}
-
     @staticmethod
-    async def generate_article_audio(article: Dict[str, str]) -> AudioArrayClip:
+    async def generate_article_audio(article: Dict[str, str]) -> str:
         """
         Generate audio from article text asynchronously.
         Args:
             article (Dict[str, str]): The article data containing title, description, and content etc.
+
+        Returns:
+            str: Path to the mp3 speech audio
         """
-        # Create a unique hash of the article text to use as cache key
-        title = article.get('title', '')
-        description = article.get('description', '')
-        content = article.get('content', '')
-        text_hash = hashlib.md5(f"{title}{description}{content}".encode('utf-8')).hexdigest()
+        # Build the SSML first (this is lightweight) and key the cache on it together with the voice and format,
+        # so changes to the text processing or voice settings never reuse stale audio
+        ssml_text = TextProcessor.prepare_article_text(article)
+        text_hash = hashlib.sha256(
+            f"{AudioSettings.DEFAULT_VOICE_ID}|{AudioSettings.DEFAULT_ENGINE}|{AudioSettings.SPEECH_SAMPLE_RATE}|{ssml_text}".encode('utf-8')
+        ).hexdigest()
         cache_file_path = os.path.join(PathSettings.OUTPUT_DIR, 'text_audio', f"cached_{text_hash}.mp3")
 
-        # Check if we've already generated this audio
-        if text_hash in AudioComposer._audio_cache:
-            print("🎙️ Using cached audio for article")
-            return AudioComposer._audio_cache[text_hash]
-
-        # Check if cached file exists
-        cache_exists = await _run_in_audio_executor(os.path.exists, cache_file_path)
+        # Check if a non-empty cached file exists
+        cache_exists = await _run_in_audio_executor(
+            lambda: os.path.isfile(cache_file_path) and os.path.getsize(cache_file_path) > 0
+        )
         if cache_exists:
-            print(f"🎙️ Loading cached audio from file: {cache_file_path}")
-            # Load cached audio file logic would go here
-            # For now, we'll continue with generation
+            print(f"🎙️ Using cached audio from file: {cache_file_path}")
+            return cache_file_path
 
-        # Process the text in the main thread (this is lightweight)
-        ssml_text = TextProcessor.prepare_article_text(article)
         print("🎙️ Generating audio from processed text")
 
-        # Run the CPU-intensive text-to-speech in executor
-        audio = await _run_in_audio_executor(
+        # Run the network-bound text-to-speech in executor; the audio is streamed to the cache file
+        return await _run_in_audio_executor(
             convert_text_to_speech,
             ssml_text,
+            cache_file_path,
             AudioSettings.DEFAULT_VOICE_ID,
             AudioSettings.DEFAULT_ENGINE,
             AudioSettings.DEFAULT_TEXT_TYPE
         )
 
-        # Cache the result
-        AudioComposer._audio_cache[text_hash] = audio
-
-        # We could also save to file for persistent caching
-        # That would require additional code
-
-        return audio
-
     @staticmethod
-    async def create_composite_audio(speech_audio: AudioArrayClip,
-                             music_audio_clip: AudioArrayClip,
-                             duration: float) -> CompositeAudioClip:
-        """Combine speech and background music asynchronously."""
-        try:
-            # These operations are CPU-bound and should run in executor
-
-            # Scale speech audio volume
-            scaled_speech = await _run_in_audio_executor(
-                speech_audio.with_volume_scaled,
-                AudioSettings.SPEECH_VOLUME
-            )
-
-            # Cut music to match speech duration and reduce volume
-            music_audio = await _run_in_audio_executor(
-                lambda: music_audio_clip.with_duration(duration).with_volume_scaled(AudioSettings.BACKGROUND_MUSIC_VOLUME)
-            )
-
-            # Create composite audio
-            composite = await _run_in_audio_executor(
-                CompositeAudioClip,
-                [scaled_speech, music_audio]
-            )
+    def build_mix_filter(speech_input: int, music_input: int, output_label: str) -> str:
+        """
+        Build the ffmpeg filter graph that mixes the speech with the background music.
 
-            return composite
-        except Exception as e:
-            print(f"Error creating composite audio: {str(e)}")
-            raise
+        Both tracks are brought to the output sample rate and layout, scaled to their volumes
+        and summed; the music is cut where the speech ends.
+        """
+        audio_format = f"aformat=sample_rates={AudioSettings.OUTPUT_SAMPLE_RATE}:channel_layouts=stereo"
+        return (
+            f"[{speech_input}:a]volume={AudioSettings.SPEECH_VOLUME},{audio_format}[speech];"
+            f"[{music_input}:a]volume={AudioSettings.BACKGROUND_MUSIC_VOLUME},{audio_format}[music];"
+            f"[speech][music]amix=inputs=2:duration=first:dropout_transition=0:normalize=0[{output_label}]"
+        )
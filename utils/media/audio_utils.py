@@ -1,10 +1,20 @@
-from io import BytesIO
+import os
+import re
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List
+
 import boto3
 from botocore.config import Config
-import numpy as np
-from moviepy.audio.AudioClip import AudioArrayClip
-from pydub import AudioSegment
+
+from settings import AudioSettings
+
+# Splits an SSML document into its <speak>/<prosody> wrapper and the spoken body
+_SSML_WRAPPER_PATTERN = re.compile(r'^(\s*<speak>\s*<prosody[^>]*>)(.*?)(</prosody>\s*</speak>\s*)$', re.DOTALL)
+# Matches a sentence ending with a <break/> tag, or the trailing text after the last break
+_SSML_SENTENCE_PATTERN = re.compile(r'.*?<break[^>]*/>|.+', re.DOTALL)
 
 def _init_polly_client():
     """Initialize and return AWS Polly client with proper timeout settings."""
@@ -19,75 +29,72 @@ def _init_polly_client():
     )
     return boto3.client("polly", config=config)
 
-def _process_audio_stream(audio_stream: bytes) -> AudioArrayClip:
+def split_ssml(ssml: str, max_chars: int = AudioSettings.SSML_CHUNK_MAX_CHARS) -> List[str]:
     """
-    Process raw audio stream into an AudioArrayClip.
+    Split an SSML document into smaller documents at <break/> boundaries.
+
+    Every chunk is wrapped in the same <speak>/<prosody> tags as the original so it
+    can be synthesized on its own.
 
     Args:
-        audio_stream: Raw audio data in bytes
+        ssml: The SSML document to split
+        max_chars: Maximum number of characters per chunk
 
     Returns:
-        AudioArrayClip: Processed audio clip
+        List[str]: SSML documents, in reading order
     """
-    # Convert audio stream to AudioSegment
-    audio_data = BytesIO(audio_stream)
-    audio_segment = AudioSegment.from_mp3(audio_data)
+    if len(ssml) <= max_chars:
+        return [ssml]
 
-    # Convert to numpy array and normalize
-    samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
-    samples = samples / (2**15)  # Normalize Polly output to range [-1, 1]
+    match = _SSML_WRAPPER_PATTERN.match(ssml)
+    if not match:
+        return [ssml]
 
-    # Create and return AudioArrayClip
-    fps = audio_segment.frame_rate
-    return AudioArrayClip(samples.reshape(-1, 1), fps)
+    head, body, tail = match.groups()
+    budget = max_chars - len(head) - len(tail)
 
-def convert_text_to_speech(
-    text: str,
-    voice_id: str = "Joanna",
-    engine: str = "neural",
-    text_type: str = "ssml"
-) -> AudioArrayClip:
-    """
-    Generate audio from text using AWS Polly.
+    chunks = []
+    current = ""
+    for sentence in _SSML_SENTENCE_PATTERN.findall(body):
+        if current and len(current) + len(sentence) > budget:
+            chunks.append(f"{head}{current}{tail}")
+            current = ""
+        current += sentence
 
-    Args:
-        text: The text to convert to speech
-        voice_id: AWS Polly voice ID (default: Matthew)
-        engine: AWS Polly engine type (default: neural)
-        text_type: Type of input text - 'text' or 'ssml' (default: text)
+    if current.strip():
+        chunks.append(f"{head}{current}{tail}")
 
-    Returns:
-        AudioArrayClip: Generated audio as MoviePy AudioArrayClip
+    return chunks
 
-    Raises:
-        ValueError: If text_type is invalid
-        RuntimeError: If audio generation fails
+def _synthesize_speech(polly, text: str, voice_id: str, engine: str, text_type: str, output_file: BinaryIO) -> None:
     """
-    if text_type not in ["text", "ssml"]:
-        raise ValueError("text_type must be either 'text' or 'ssml'")
+    Synthesize a single Polly request, retrying on read timeouts.
 
+    The mp3 audio is streamed into output_file in fixed-size blocks rather than
+    being read into memory in one piece.
+    """
     # Implement retry logic for network issues
     max_retries = 3
     retry_delay = 2  # seconds
+    start = output_file.tell()
 
     for attempt in range(1, max_retries + 1):
         try:
-            polly = _init_polly_client()
-
-            print(f"🎙️ Generating speech (attempt {attempt}/{max_retries})...")
+            # Discard anything a failed attempt already wrote
+            output_file.seek(start)
+            output_file.truncate()
 
             # Generate speech using Polly
             response = polly.synthesize_speech(
                 Text=text,
                 TextType=text_type,
                 OutputFormat="mp3",
+                SampleRate=str(AudioSettings.SPEECH_SAMPLE_RATE),
                 VoiceId=voice_id,
                 Engine=engine
             )
-
-            audio_clip = _process_audio_stream(response["AudioStream"].read())
-            print("🎙️ ✅ Audio generated successfully")
-            return audio_clip
+            shutil.copyfileobj(response["AudioStream"], output_file, AudioSettings.STREAM_CHUNK_SIZE)
+            return
 
         except Exception as e:
             if "Read timeout" in str(e) and attempt < max_retries:
@@ -95,6 +102,83 @@ def convert_text_to_speech(
                 time.sleep(retry_delay)
                 retry_delay *= 2  # Exponential backoff
             else:
-                error_msg = f"Error generating audio: {str(e)}"
-                print(f"❌ {error_msg}")
-                raise RuntimeError(error_msg) from e
+                raise
+
+def _synthesize_chunks(polly, chunks: List[str], voice_id: str, engine: str, text_type: str, output_file: BinaryIO) -> None:
+    """Synthesize SSML chunks concurrently and append their audio to output_file in reading order."""
+    print(f"🎙️ Synthesizing {len(chunks)} SSML chunks concurrently...")
+    parts = [tempfile.TemporaryFile() for _ in chunks]
+    try:
+        max_workers = min(len(chunks), AudioSettings.MAX_SYNTHESIS_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(
+                lambda chunk, part: _synthesize_speech(polly, chunk, voice_id, engine, text_type, part),
+                chunks,
+                parts
+            ))
+
+        # mp3 is a plain sequence of frames, so ffmpeg decodes the concatenated chunks as one stream
+        for part in parts:
+            part.seek(0)
+            shutil.copyfileobj(part, output_file, AudioSettings.STREAM_CHUNK_SIZE)
+    finally:
+        for part in parts:
+            part.close()
+
+def convert_text_to_speech(
+    text: str,
+    output_filename: str,
+    voice_id: str = "Joanna",
+    engine: str = "neural",
+    text_type: str = "ssml"
+) -> str:
+    """
+    Generate audio from text using AWS Polly.
+
+    Long SSML input is split at <break/> boundaries and the chunks are synthesized
+    concurrently, then joined back together in order.
+
+    Args:
+        text: The text to convert to speech
+        output_filename: Path where the mp3 audio is saved
+        voice_id: AWS Polly voice ID (default: Matthew)
+        engine: AWS Polly engine type (default: neural)
+        text_type: Type of input text - 'text' or 'ssml' (default: text)
+
+    Returns:
+        str: Path to the generated mp3 audio
+
+    Raises:
+        ValueError: If text_type is invalid
+        RuntimeError: If audio generation fails
+    """
+    if text_type not in ["text", "ssml"]:
+        raise ValueError("text_type must be either 'text' or 'ssml'")
+
+    chunks = split_ssml(text) if text_type == "ssml" else [text]
+
+    # Write to a temporary file first so a failed run never leaves a truncated audio file behind
+    output_dir = os.path.dirname(output_filename) or "."
+    os.makedirs(output_dir, exist_ok=True)
+    temp_file = tempfile.NamedTemporaryFile(dir=output_dir, suffix=".part", delete=False)
+
+    try:
+        # boto3 clients are thread-safe, so one client serves all chunks
+        polly = _init_polly_client()
+
+        with temp_file:
+            if len(chunks) == 1:
+                _synthesize_speech(polly, chunks[0], voice_id, engine, text_type, temp_file)
+            else:
+                _synthesize_chunks(polly, chunks, voice_id, engine, text_type, temp_file)
+        os.replace(temp_file.name, output_filename)
+
+        print("🎙️ ✅ Audio generated successfully")
+        return output_filename
+
+    except Exception as e:
+        if os.path.exists(temp_file.name):
+            os.remove(temp_file.name)
+        error_msg = f"Error generating audio: {str(e)}"
+        print(f"❌ {error_msg}")
+        raise RuntimeError(error_msg) from e
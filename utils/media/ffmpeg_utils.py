@@ -0,0 +1,122 @@
+"""Helpers for driving the ffmpeg encoder used for the final render."""
+
+from functools import lru_cache
+import os
+import subprocess
+from typing import List, Optional, Tuple
+
+from moviepy.config import FFMPEG_BINARY
+
+from settings import VideoSettings
+
+
+def _list_encoders() -> str:
+    """Return the output of `ffmpeg -encoders`, or an empty string if ffmpeg can't be run."""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=15
+        )
+        return result.stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+
+
+def _get_codec_options(codec: str) -> Tuple[str, List[str]]:
+    """Get the preset and extra ffmpeg parameters configured for an encoder."""
+    if codec in VideoSettings.HW_VIDEO_CODECS:
+        options = VideoSettings.HW_VIDEO_CODECS[codec]
+        return options["preset"], list(options["ffmpeg_params"])
+    return VideoSettings.FFMPEG_PRESET, ["-tune", VideoSettings.FFMPEG_TUNE]
+
+
+def _encoder_works(codec: str) -> bool:
+    """
+    Check that the encoder can actually encode a few frames on this machine, with the same
+    options, pixel format and frame size as the real render.
+    """
+    preset, ffmpeg_params = _get_codec_options(codec)
+    try:
+        result = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", f"color=c=black:s={VideoSettings.FRAME_SIZE}:r={VideoSettings.FPS}:d=0.2",
+             "-pix_fmt", VideoSettings.PIXEL_FORMAT,
+             "-c:v", codec, "-preset", preset, *ffmpeg_params, "-f", "null", "-"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+@lru_cache(maxsize=1)
+def get_h264_encoder() -> str:
+    """
+    Pick the H.264 encoder for the final render.
+
+    Hardware encoders from VideoSettings.HW_VIDEO_CODECS are tried in order. Most ffmpeg
+    builds list them even when the matching GPU is absent, so each listed one is verified
+    with a short test encode. Falls back to VideoSettings.VIDEO_CODEC.
+
+    Returns:
+        str: The ffmpeg encoder name
+    """
+    available = _list_encoders()
+    for codec in VideoSettings.HW_VIDEO_CODECS:
+        if f" {codec} " in available and _encoder_works(codec):
+            print(f"🎞️ Using hardware video encoder: {codec}")
+            return codec
+    return VideoSettings.VIDEO_CODEC
+
+
+def get_encoder_options(codec: Optional[str] = None) -> Tuple[str, str, List[str]]:
+    """
+    Get the codec, preset and extra ffmpeg parameters for the final render.
+
+    Args:
+        codec: Encoder to use; defaults to the one picked by get_h264_encoder
+
+    Returns:
+        Tuple containing:
+            - Encoder name
+            - Encoder preset
+            - Extra ffmpeg output parameters
+    """
+    codec = codec or get_h264_encoder()
+    preset, ffmpeg_params = _get_codec_options(codec)
+    return codec, preset, ffmpeg_params
+
+
+def get_encoder_threads() -> int:
+    """
+    Get the encoder thread count for one render.
+
+    Up to VideoSettings.MAX_CONCURRENT_RENDERS renders run at once, so the cores are split
+    between them instead of every ffmpeg process sizing its thread pool for the whole machine.
+    """
+    return max(1, (os.cpu_count() or 1) // VideoSettings.MAX_CONCURRENT_RENDERS)
+
+
+def get_audio_duration(audio_file: str) -> float:
+    """
+    Get the duration of an audio file from ffmpeg's machine-readable progress report.
+    The audio is stream-copied rather than decoded, so only the packet timestamps are read.
+
+    Args:
+        audio_file: Path to the audio file
+
+    Returns:
+        float: Duration in seconds
+
+    Raises:
+        RuntimeError: If ffmpeg can't read the file
+    """
+    result = subprocess.run(
+        [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-i", audio_file,
+         "-map", "0:a", "-c", "copy", "-f", "null", "-progress", "pipe:1", "-"],
+        capture_output=True, text=True
+    )
+    out_times = [line.split("=", 1)[1] for line in result.stdout.splitlines() if line.startswith("out_time_us=")]
+    if result.returncode != 0 or not out_times or not out_times[-1].isdigit():
+        raise RuntimeError(f"ffmpeg could not read the duration of {audio_file}: {result.stderr.strip()}")
+    return int(out_times[-1]) / 1_000_000
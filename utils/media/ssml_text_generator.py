@@ -2,6 +2,19 @@ import re
 from typing import Dict
 from settings import AudioSettings
 
+# Trailing truncation marker added by the news API, e.g. '... [1234 chars]'
+_TRUNCATION_MARKER_PATTERN = re.compile(r'\.\.\.\s*\[\d+\s+chars\]$')
+# Any group of sentence punctuation characters
+_PUNCTUATION_PATTERN = re.compile(r'[.!?:]+')
+# Escapes for characters with special meaning in SSML, applied in a single pass
+_SSML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "\"": "&quot;",
+    "'": "&apos;"
+})
+
 # TODO: content of the article is incomplete, update API or use article.url to scrape full / longer content
 class TextProcessor:
     """Handles text processing and SSML formatting for audio generation."""
@@ -9,23 +22,14 @@ class TextProcessor:
     @staticmethod
     def clean_content(text: str) -> str:
         """Remove trailing pattern like '... [1234 chars]' from text."""
-        return re.sub(r'\.\.\.\s*\[\d+\s+chars\]$', '', text.strip())
+        return _TRUNCATION_MARKER_PATTERN.sub('', text.strip())
 
     @staticmethod
     def escape_ssml_characters(text: str) -> str:
         """
         Escapes special characters for safe use in SSML.
         """
-        replacements = {
-            "&": "&amp;",
-            "<": "&lt;",
-            ">": "&gt;",
-            "\"": "&quot;",
-            "'": "&apos;"
-        }
-        for char, escape in replacements.items():
-            text = text.replace(char, escape)
-        return text
+        return text.translate(_SSML_ESCAPE_TABLE)
 
     @staticmethod
     def add_breaks_to_punctuation(text: str, break_time: int = 1000) -> str:
@@ -38,7 +42,7 @@ class TextProcessor:
 
         text = TextProcessor.escape_ssml_characters(text)
         # Replace using regex
-        text_with_break = re.sub(r'[.!?:]+', replacer, text)
+        text_with_break = _PUNCTUATION_PATTERN.sub(replacer, text)
 
         # Add long break after complete text
         text_with_break = f"{text_with_break} <break time=\"4000ms\"/>"
@@ -67,7 +71,7 @@ class TextProcessor:
 
         final_text = ". ".join(text_parts)
         final_text = cls.add_breaks_to_punctuation(final_text)
-        print(f"Generated text for audio: {final_text}")
+        print(f"Generated text for audio ({len(final_text)} chars)")
 
         ssml_text = f"""
         <speak>
@@ -1,26 +1,89 @@
-from moviepy.video.VideoClip import ImageClip
-from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
-from moviepy.audio.AudioClip import CompositeAudioClip
+import subprocess
+from typing import List, Optional
+
+from moviepy.config import FFMPEG_BINARY
+
 from settings import VideoSettings
+from utils.media.audio_composer import AudioComposer
+from utils.media.ffmpeg_utils import get_encoder_options, get_encoder_threads, get_h264_encoder
 
 class VideoComposer:
     """Handles video composition and rendering."""
 
     @staticmethod
-    def create_composite_video(bg_clip: ImageClip,
-                               overlay_clip: ImageClip,
-                               combined_audio: CompositeAudioClip,
-                               duration: float) -> CompositeVideoClip:
-        """Create composite video with background and overlay."""
-
-        # Configure video clips
-        bg_clip = bg_clip.with_duration(duration).with_fps(VideoSettings.FPS)
-        overlay_clip = (overlay_clip
-                        .with_duration(duration)
-                        .resized(height=VideoSettings.IMAGE_HEIGHT)
-                        .with_position(("center", bg_clip.h // 2 - VideoSettings.IMAGE_VERTICAL_OFFSET)))
-
-        # Combine everything
-        final = CompositeVideoClip([bg_clip, overlay_clip]).with_audio(combined_audio).with_duration(duration)
-
-        return final
\ No newline at end of file
+    def _run_ffmpeg(command: List[str]) -> subprocess.CompletedProcess:
+        """Run an ffmpeg command, capturing its error output."""
+        return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    @staticmethod
+    def build_render_command(bg_image: str,
+                             overlay_image: str,
+                             speech_audio: str,
+                             bg_music: str,
+                             output_path: str,
+                             duration: float,
+                             codec: Optional[str] = None) -> List[str]:
+        """
+        Build the ffmpeg command that renders the background, overlay card, speech and music into the final video.
+        Uses the given video encoder, or the one picked by get_h264_encoder.
+        """
+        codec, preset, ffmpeg_params = get_encoder_options(codec)
+
+        # Scale the card, place it centered horizontally and offset upwards from the vertical middle,
+        # then repeat the single composited frame for the whole video
+        filter_graph = (
+            f"[1:v]scale=-1:{VideoSettings.IMAGE_HEIGHT}[card];"
+            f"[0:v][card]overlay=(W-w)/2:trunc(H/2)-{VideoSettings.IMAGE_VERTICAL_OFFSET},"
+            f"format={VideoSettings.PIXEL_FORMAT},loop=loop=-1:size=1[video];"
+            + AudioComposer.build_mix_filter(speech_input=2, music_input=3, output_label="audio")
+        )
+
+        return [
+            FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+            "-framerate", str(VideoSettings.FPS), "-i", bg_image,
+            "-framerate", str(VideoSettings.FPS), "-i", overlay_image,
+            # Speech is the Polly mp3 from the TTS cache, decoded by ffmpeg itself
+            "-i", speech_audio,
+            "-i", bg_music,
+            "-filter_complex", filter_graph,
+            "-map", "[video]", "-map", "[audio]",
+            "-c:v", codec, "-preset", preset, *ffmpeg_params,
+            "-threads", str(get_encoder_threads()),
+            "-c:a", VideoSettings.AUDIO_CODEC,
+            "-t", f"{duration:.3f}",
+            "-movflags", "+faststart",
+            output_path
+        ]
+
+    @staticmethod
+    def render_video(bg_image: str,
+                     overlay_image: str,
+                     speech_audio: str,
+                     bg_music: str,
+                     output_path: str,
+                     duration: float) -> None:
+        """
+        Render the final video with a single ffmpeg run.
+
+        The background and the card are static, so ffmpeg composites them once and repeats
+        that frame, and mixes the speech with the background music in the same filter graph,
+        instead of MoviePy compositing every frame and audio sample in Python.
+        If a hardware encoder fails, the render is retried once with VideoSettings.VIDEO_CODEC.
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        codec = get_h264_encoder()
+        result = VideoComposer._run_ffmpeg(VideoComposer.build_render_command(
+            bg_image, overlay_image, speech_audio, bg_music, output_path, duration, codec
+        ))
+
+        # A hardware encoder can pass the startup probe and still fail on a real render
+        if result.returncode != 0 and codec != VideoSettings.VIDEO_CODEC:
+            print(f"⚠️ {codec} failed to render {output_path}, retrying with {VideoSettings.VIDEO_CODEC}: {result.stderr.strip()}")
+            result = VideoComposer._run_ffmpeg(VideoComposer.build_render_command(
+                bg_image, overlay_image, speech_audio, bg_music, output_path, duration, VideoSettings.VIDEO_CODEC
+            ))
+
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to render {output_path}: {result.stderr.strip()}")
@@ -1,9 +1,29 @@
+from functools import lru_cache
+from itertools import chain
 from typing import List, Optional, Tuple
 
 from settings import YouTubeSettings
 from utils.metadata.tag_utils import generate_tags_with_frequency
 
 
+@lru_cache(maxsize=512)
+def _generate_article_tags(
+    title: str,
+    description: str,
+    content: str,
+    source_name: str,
+    max_tags: int
+) -> Tuple[str, ...]:
+    """Memoized frequency-based tags for the given article text fields."""
+    article = {
+        "title": title,
+        "description": description,
+        "content": content,
+        "source": {"name": source_name}
+    }
+    return tuple(tag for tag, _ in generate_tags_with_frequency(article, max_tags=max_tags))
+
+
 def generate_video_tags(
     article: dict,
     category: str,
@@ -29,26 +49,23 @@ def generate_video_tags(
     else:
         category_tags = YouTubeSettings.CATEGORY_HASHTAG_MAP.get(category.lower(), [])
 
-    # Generate dynamic tags from article content
-    article_tags = [
-        tag for tag, _ in generate_tags_with_frequency(
-            article,
-            max_tags=YouTubeSettings.ARTICLE_MAX_TAGS
-        )
-    ]
+    # Generate dynamic tags from article content, reusing earlier results for the same article
+    article_tags = list(_generate_article_tags(
+        article.get("title", ""),
+        article.get("description", ""),
+        article.get("content", ""),
+        article.get("source", {}).get("name", ""),
+        YouTubeSettings.ARTICLE_MAX_TAGS
+    ))
 
     # Combine tags ensuring uniqueness and proper limits
     hashtag_tags = [''.join(hashtag.lstrip("#").split())] if hashtag else []
 
     # Combine tags from all sources, removing case-insensitive duplicates while preserving original order and casing
-    seen = set()
-    combined_tags = []
-
+    unique_tags = {}
     for tag in hashtag_tags + article_tags + category_tags:
-        tag_lower = tag.lower()
-        if tag_lower not in seen:
-            seen.add(tag_lower)
-            combined_tags.append(tag)
+        unique_tags.setdefault(tag.lower(), tag)
+    combined_tags = list(unique_tags.values())
 
     return article_tags, combined_tags
 
@@ -69,19 +86,20 @@ def generate_video_title(
     Returns:
         Formatted video title
     """
-    article_title = article.get("title", "No Title")
+    # Collapse runs of whitespace in the title once
+    title_clean = " ".join(article.get("title", "No Title").split())
     # If hashtag, use that else (category case) use first article tag
-    title_hashtag_str = f"#{''.join(hashtag.lstrip("#").split())}" if hashtag else f"#{article_tags[0]}"
+    title_hashtag_str = "#" + ("".join(hashtag.lstrip("#").split()) if hashtag else article_tags[0])
 
     # Create base title with prefix
     base_title = "Breaking News: "
     # Calculate remaining characters for article title considering hashtag
-    max_article_length = 100 - len(base_title) - len(title_hashtag_str) - 1  # -1 for space before hashtag
-    truncated_article_title = ' '.join(article_title.split())
-    if len(truncated_article_title) > max_article_length:
-        truncated_article_title = truncated_article_title[:max_article_length].rsplit(' ', 1)[0]
+    budget = 100 - len(base_title) - len(title_hashtag_str) - 1  # -1 for space before hashtag
+    if len(title_clean) > budget:
+        # Cut at the last word boundary, or hard-cut a single overlong word
+        title_clean = title_clean[:budget].rpartition(" ")[0] or title_clean[:budget]
 
-    return f"{base_title}{truncated_article_title} {title_hashtag_str}"
+    return f"{base_title}{title_clean} {title_hashtag_str}"
 
 
 def generate_video_description(
@@ -105,26 +123,24 @@ def generate_video_description(
     source_url = article.get("url", "")
     source_name = article.get("source", {}).get("name", "")
 
-    # Hashtags from combined tags and extra tags
-    combined_tags_str = " ".join(f"#{tag}" for tag in combined_tags)
-    extra_tags_str = " ".join(f"#{tag}" for tag in YouTubeSettings.EXTRA_DESCRIPTION_HASHTAGS)
-
     # Build description parts
     description_parts = [article_description]
 
     # Append source name if available
-    source_name_hashtag = ""
     if source_name:
         description_parts.append(f"Source: {source_name}")
-        source_name_hashtag = f"#{source_name.replace(' ', '')}"
 
     # Append source URL if available
     if source_url:
         description_parts.append(f"{source_url}")
 
-    # Append hashtags at the end of the description if available
-    if combined_tags_str or extra_tags_str or source_name_hashtag:
-        description_parts.append(f"{combined_tags_str} {extra_tags_str} {source_name_hashtag}".strip())
+    # Append hashtags from combined tags, extra tags and the source name at the end, built in a single join
+    source_name_tags = [source_name.replace(' ', '')] if source_name else []
+    hashtags_str = " ".join(
+        f"#{tag}" for tag in chain(combined_tags, YouTubeSettings.EXTRA_DESCRIPTION_HASHTAGS, source_name_tags)
+    )
+    if hashtags_str:
+        description_parts.append(hashtags_str)
 
     # Join all parts into a single description string
     return "\n\n".join(description_parts).strip()
@@ -4,40 +4,109 @@ Provides functionality to render HTML files to images using headless Chrome.
 """
 
 # Standard library imports
+import atexit
+import base64
+from contextlib import contextmanager
 import os
-from time import sleep
+import queue
 import tempfile
 import threading
 
 # Third-party imports
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from settings.media import BrowserSettings
 
 
-# Global lock for browser operations
-_browser_lock = threading.Lock()
-# Singleton pattern for ChromeDriverManager to prevent multiple downloads
-_driver_manager = None
-_driver_manager_lock = threading.Lock()
+# Pool of long-lived browsers: idle ones wait in _idle_drivers, and at most
+# BrowserSettings.POOL_SIZE are checked out (and therefore launched) at once
+_idle_drivers = queue.LifoQueue()
+_pool_slots = threading.BoundedSemaphore(BrowserSettings.POOL_SIZE)
 
+# True once the page, its fonts and all of its images have finished loading
+_PAGE_READY_SCRIPT = (
+    "return document.readyState === 'complete'"
+    " && document.fonts.status === 'loaded'"
+    " && Array.from(document.images).every(img => img.complete);"
+)
 
-def get_chrome_driver_manager():
-    """Get or create a singleton ChromeDriverManager instance."""
-    global _driver_manager
-    with _driver_manager_lock:
-        if _driver_manager is None:
-            _driver_manager = ChromeDriverManager()
-        return _driver_manager
+
+def _create_driver() -> webdriver.Chrome:
+    """Launch a headless Chrome browser configured for card rendering."""
+    # Configure Chrome options for headless operation
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument(f'--window-size={BrowserSettings.WINDOW_WIDTH},{BrowserSettings.WINDOW_HEIGHT}')
+
+    # Add unique user data directory
+    temp_dir = tempfile.mkdtemp()
+    options.add_argument(f'--user-data-dir={temp_dir}')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+
+    # Cards are static local pages; skip browser features that only add rendering work
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--hide-scrollbars')
+    options.add_argument('--force-device-scale-factor=1')
+
+    # Selenium Manager finds a matching chromedriver on PATH or in its cache, downloading only when missing
+    return webdriver.Chrome(options=options)
+
+
+def _quit_driver(driver: webdriver.Chrome) -> None:
+    """Quit a browser, reporting but not raising errors."""
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"Error while closing browser: {str(e)}")
+
+
+@contextmanager
+def _checkout_driver():
+    """
+    Borrow a browser from the pool, launching a new one if none is idle.
+    Blocks while all BrowserSettings.POOL_SIZE browsers are in use.
+    """
+    with _pool_slots:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = _create_driver()
+
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            # The browser may have crashed; drop it so a later render starts a fresh one
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                _idle_drivers.put(driver)
+            else:
+                _quit_driver(driver)
+
+
+@atexit.register
+def close_browser() -> None:
+    """Quit all pooled browsers at interpreter exit."""
+    while True:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+        _quit_driver(driver)
 
 
 def render_card_to_image(html_file: str, output_image: str) -> None:
     """
     Renders an HTML file to an image using headless Chrome browser.
-    Uses a global lock to prevent concurrent ChromeDriver access.
+    Browsers are launched once and reused across calls; up to
+    BrowserSettings.POOL_SIZE cards are rendered in parallel.
 
     Args:
         html_file (str): Path to the HTML file to be rendered
@@ -51,57 +120,42 @@ def render_card_to_image(html_file: str, output_image: str) -> None:
         WebDriverException: If there's an issue with the browser
         Exception: For other unexpected errors
     """
-    driver = None
-
-    # Use a lock to prevent concurrent ChromeDriver operations
-    with _browser_lock:
-        try:
-            if not os.path.exists(html_file):
-                raise FileNotFoundError(f"HTML file not found: {html_file}")
-
-            # Configure Chrome options for headless operation
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument(f'--window-size={BrowserSettings.WINDOW_WIDTH},{BrowserSettings.WINDOW_HEIGHT}')
-
-            # Add unique user data directory
-            temp_dir = tempfile.mkdtemp()
-            options.add_argument(f'--user-data-dir={temp_dir}')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
+    try:
+        if not os.path.exists(html_file):
+            raise FileNotFoundError(f"HTML file not found: {html_file}")
 
-            # Get the driver path using the singleton manager
-            driver_manager = get_chrome_driver_manager()
-            driver_path = driver_manager.install()
+        # Convert local file path to URL format
+        file_path = f"file://{os.path.abspath(html_file)}"
 
-            # Initialize Chrome WebDriver with the installed driver
-            driver = webdriver.Chrome(service=Service(driver_path), options=options)
-
-            # Convert local file path to URL format
-            file_path = f"file://{os.path.abspath(html_file)}"
+        # Create output directory if it doesn't exist
+        os.makedirs(os.path.dirname(output_image), exist_ok=True)
 
+        with _checkout_driver() as driver:
             # Load and render the HTML file
             driver.get(file_path)
-            sleep(BrowserSettings.BROWSER_WAIT_TIME)  # Wait for the page to render completely
-
-            # Create output directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_image), exist_ok=True)
 
-            # Capture screenshot
-            driver.save_screenshot(output_image)
-
-        except FileNotFoundError as e:
-            print(f"File error: {str(e)}")
-            raise
-        except WebDriverException as e:
-            print(f"Browser error: {str(e)}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error: {str(e)}")
-            raise
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    print(f"Error while closing browser: {str(e)}")
+            # Wait until the page has actually finished loading instead of a fixed delay
+            try:
+                WebDriverWait(driver, BrowserSettings.BROWSER_WAIT_TIME).until(
+                    lambda d: d.execute_script(_PAGE_READY_SCRIPT)
+                )
+            except TimeoutException:
+                print(f"⚠️ Page not fully loaded after {BrowserSettings.BROWSER_WAIT_TIME}s, capturing anyway: {html_file}")
+
+            # Capture the screenshot straight over CDP, favouring encode speed over PNG size
+            screenshot = driver.execute_cdp_cmd(
+                "Page.captureScreenshot", {"format": "png", "optimizeForSpeed": True}
+            )
+
+        with open(output_image, "wb") as image_file:
+            image_file.write(base64.b64decode(screenshot["data"]))
+
+    except FileNotFoundError as e:
+        print(f"File error: {str(e)}")
+        raise
+    except WebDriverException as e:
+        print(f"Browser error: {str(e)}")
+        raise
+    except Exception as e:
+        print(f"Unexpected error: {str(e)}")
+        raise
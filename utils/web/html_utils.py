@@ -1,54 +1,14 @@
 from datetime import datetime, timezone, timedelta
 import os
+from pathlib import Path
 from settings import HTMLSettings
+from utils.web.image_cache import get_cached_image
 
-# --- GENERATE HTML ---
-def create_html_card(article, output_path="temp.html"):
-    """
-    Creates an HTML card from the given article data.
+# Indian Standard Time (UTC+5:30), used for the published date on the card
+_IST = timezone(timedelta(hours=5, minutes=30))
 
-    Args:
-        article (dict): Article data containing title, description, etc.
-        output_path (str): Path where the HTML file will be saved
-
-    Raises:
-        ValueError: If article data is invalid
-        IOError: If there's an error writing the file
-    """
-    try:
-        # Pre-calculate all article-related variables
-        title = article.get("title", "No Title")
-        description = article.get("description", "No Description")
-        image_url = article.get("image", "")
-        published_at = article.get("publishedAt")
-        source = article.get('source', {}).get('name', 'Unknown')
-
-        # Source of the article
-        print(f"🌐 News Source: {source}")
-
-        # Process image HTML
-        image_html = f"<img src='{image_url}' alt='News image'>" if image_url else ""
-
-        # Process publish date to IST
-        published = "Unknown"
-        if published_at:
-            try:
-                # Parse as UTC-aware datetime
-                dt = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-
-                # Convert to IST (UTC+5:30)
-                ist = timezone(timedelta(hours=5, minutes=30))
-                ist_time = dt.astimezone(ist)
-
-                # Format as readable IST time
-                published = ist_time.strftime("%Y-%m-%d %H:%M")
-            except ValueError as e:
-                print(f"Error parsing date: {str(e)}")
-
-        html_template = """
-        <html>
-          <head>
-            <style>
+# The card styling depends only on HTMLSettings, so it is formatted once at import
+_CARD_STYLESHEET = """
               body {{
                 font-family: {font_family};
                 background-color: #f9f9f9;
@@ -92,7 +52,21 @@ def create_html_card(article, output_path="temp.html"):
                 color: gray;
                 margin-top: 12px;
               }}
-            </style>
+""".format(
+    width=HTMLSettings.CARD_WIDTH,
+    border_radius=HTMLSettings.BORDER_RADIUS,
+    title_size=HTMLSettings.TITLE_FONT_SIZE,
+    title_margin=HTMLSettings.TITLE_MARGIN_TOP,
+    desc_size=HTMLSettings.DESCRIPTION_FONT_SIZE,
+    meta_size=HTMLSettings.META_FONT_SIZE,
+    font_family=HTMLSettings.FONT_FAMILY
+)
+
+# Per-article page; only the article fields are filled in for each card
+_CARD_HTML_TEMPLATE = """
+        <html>
+          <head>
+            <style>{stylesheet}            </style>
           </head>
           <body>
             <div class="card">
@@ -111,14 +85,54 @@ def create_html_card(article, output_path="temp.html"):
         </html>
         """
 
-        html_content = html_template.format(
-            width=HTMLSettings.CARD_WIDTH,
-            border_radius=HTMLSettings.BORDER_RADIUS,
-            title_size=HTMLSettings.TITLE_FONT_SIZE,
-            title_margin=HTMLSettings.TITLE_MARGIN_TOP,
-            desc_size=HTMLSettings.DESCRIPTION_FONT_SIZE,
-            meta_size=HTMLSettings.META_FONT_SIZE,
-            font_family=HTMLSettings.FONT_FAMILY,
+# --- GENERATE HTML ---
+def create_html_card(article, output_path="temp.html"):
+    """
+    Creates an HTML card from the given article data.
+
+    Args:
+        article (dict): Article data containing title, description, etc.
+        output_path (str): Path where the HTML file will be saved
+
+    Raises:
+        ValueError: If article data is invalid
+        IOError: If there's an error writing the file
+    """
+    try:
+        # Pre-calculate all article-related variables
+        title = article.get("title", "No Title")
+        description = article.get("description", "No Description")
+        image_url = article.get("image", "")
+        published_at = article.get("publishedAt")
+        source = article.get('source', {}).get('name', 'Unknown')
+
+        # Source of the article
+        print(f"🌐 News Source: {source}")
+
+        # Process image HTML, pointing at the locally cached copy when it could be downloaded
+        image_html = ""
+        if image_url:
+            cached_image = get_cached_image(image_url)
+            image_src = Path(cached_image).resolve().as_uri() if cached_image else image_url
+            image_html = f"<img src='{image_src}' alt='News image'>"
+
+        # Process publish date to IST
+        published = "Unknown"
+        if published_at:
+            try:
+                # Parse as UTC-aware datetime
+                dt = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+                # Convert to IST (UTC+5:30)
+                ist_time = dt.astimezone(_IST)
+
+                # Format as readable IST time
+                published = ist_time.strftime("%Y-%m-%d %H:%M")
+            except ValueError as e:
+                print(f"Error parsing date: {str(e)}")
+
+        html_content = _CARD_HTML_TEMPLATE.format(
+            stylesheet=_CARD_STYLESHEET,
             title=title,
             description=description,
             image_html=image_html,
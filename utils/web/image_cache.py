@@ -0,0 +1,191 @@
+"""
+On-disk cache for article images.
+Lets the card page load the article image from a local file instead of fetching
+it from the publisher on every render.
+"""
+
+# Standard library imports
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+# Third-party imports
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from settings import HTMLSettings, PathSettings
+from settings.media import BrowserSettings
+
+
+# Shared HTTP session so repeated downloads from the same host reuse keep-alive connections
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get or create the shared requests Session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=BrowserSettings.IMAGE_DOWNLOAD_POOL_SIZE,
+                pool_maxsize=BrowserSettings.IMAGE_DOWNLOAD_POOL_SIZE,
+                # Also retry transient gateway errors from the image CDN, with a short backoff
+                max_retries=Retry(
+                    total=BrowserSettings.IMAGE_DOWNLOAD_RETRIES,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504)
+                )
+            )
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+# Background downloads started by prefetch_images, keyed by URL until a card claims them
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetches: Dict[str, Future] = {}
+_prefetch_lock = threading.Lock()
+
+
+# EXIF orientations that swap the stored width and height (transpose/rotate 90/transverse/rotate 270)
+_TRANSPOSING_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def _downscale_to_card_width(image_path: str) -> None:
+    """
+    Shrink an image wider than the card to exactly the card width, in place.
+    The card shows images at HTMLSettings.CARD_WIDTH, so storing them at that size spares
+    the browser decoding and scaling a full-resolution photo on every render.
+    """
+    with Image.open(image_path) as img:
+        # Size by the displayed orientation; the browser shows the photo rotated per its EXIF tag
+        rotated = img.getexif().get(ExifTags.Base.Orientation) in _TRANSPOSING_ORIENTATIONS
+        width, height = (img.height, img.width) if rotated else img.size
+        if width <= HTMLSettings.CARD_WIDTH:
+            return
+        image_format = img.format
+        icc_profile = img.info.get("icc_profile")
+        size = (HTMLSettings.CARD_WIDTH, round(height * HTMLSettings.CARD_WIDTH / width))
+        # For JPEGs, let the decoder downscale by a power of two while decoding
+        img.draft("RGB", size[::-1] if rotated else size)
+        # The orientation tag isn't kept on save, so bake it into the pixels first
+        upright = ImageOps.exif_transpose(img)
+        resized = upright.resize(size, Image.LANCZOS, reducing_gap=2.0)
+
+    if image_format == "JPEG":
+        resized.save(image_path, format="JPEG", quality=95, icc_profile=icc_profile)
+    else:
+        # The browser reads this straight back from local disk, so favour encode speed over size
+        resized.save(image_path, format="PNG", compress_level=1, icc_profile=icc_profile)
+
+
+def _get_cache_path(url: str) -> str:
+    """Get the cache file path for an image URL."""
+    return os.path.join(PathSettings.ARTICLE_IMAGE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool that runs image downloads. Callers must hold _prefetch_lock."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=BrowserSettings.IMAGE_PREFETCH_WORKERS)
+    return _prefetch_executor
+
+
+def _download_image(url: str) -> Optional[str]:
+    """
+    Download an image into the cache unless it is already there; see get_cached_image.
+    Gives up once BrowserSettings.IMAGE_DOWNLOAD_DEADLINE has passed since the download started.
+    """
+    cache_path = _get_cache_path(url)
+    if os.path.isfile(cache_path):
+        return cache_path
+
+    deadline = time.monotonic() + BrowserSettings.IMAGE_DOWNLOAD_DEADLINE
+    temp_file = None
+    try:
+        response = _get_session().get(url, timeout=BrowserSettings.IMAGE_DOWNLOAD_TIMEOUT, stream=True)
+        response.raise_for_status()
+
+        # Bail out on HTML error pages and the like before reading the body
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.startswith(("image/", "application/octet-stream")):
+            response.close()
+            print(f"⚠️ Not caching article image {url}: unexpected content type {content_type}")
+            return None
+
+        # Write to a temporary file first so a failed download never leaves a truncated image behind
+        os.makedirs(PathSettings.ARTICLE_IMAGE_DIR, exist_ok=True)
+        temp_file = tempfile.NamedTemporaryFile(dir=PathSettings.ARTICLE_IMAGE_DIR, suffix=".part", delete=False)
+        with temp_file:
+            for chunk in response.iter_content(chunk_size=BrowserSettings.IMAGE_DOWNLOAD_CHUNK_SIZE):
+                if time.monotonic() > deadline:
+                    response.close()
+                    raise requests.Timeout(f"download took longer than {BrowserSettings.IMAGE_DOWNLOAD_DEADLINE}s")
+                temp_file.write(chunk)
+
+        try:
+            _downscale_to_card_width(temp_file.name)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError) as e:
+            # Keep the original bytes; the browser may still be able to display them
+            print(f"⚠️ Could not downscale article image {url}: {str(e)}")
+
+        os.replace(temp_file.name, cache_path)
+        return cache_path
+
+    except (requests.RequestException, OSError) as e:
+        print(f"⚠️ Could not cache article image {url}: {str(e)}")
+        if temp_file is not None and os.path.exists(temp_file.name):
+            os.remove(temp_file.name)
+        return None
+
+
+def prefetch_images(urls: Iterable[str]) -> None:
+    """
+    Start downloading article images in the background, so they are usually cached
+    by the time their cards are rendered instead of being fetched one card at a time.
+
+    Args:
+        urls (Iterable[str]): Remote image URLs; empty values are ignored
+    """
+    with _prefetch_lock:
+        for url in urls:
+            if url and url not in _prefetches:
+                _prefetches[url] = _get_prefetch_executor().submit(_download_image, url)
+
+
+def get_cached_image(url: str) -> Optional[str]:
+    """
+    Get the local copy of an article image, downloading it on first use.
+    Waits for a download already started by prefetch_images rather than starting another,
+    but never longer than BrowserSettings.IMAGE_DOWNLOAD_DEADLINE; a download that is still
+    running keeps going in the background and fills the cache for later cards.
+
+    Args:
+        url (str): Remote URL of the image
+
+    Returns:
+        Optional[str]: Path of the cached image, or None if it couldn't be downloaded in time
+    """
+    cache_path = _get_cache_path(url)
+    if os.path.isfile(cache_path):
+        return cache_path
+
+    with _prefetch_lock:
+        download = _prefetches.pop(url, None)
+        if download is None:
+            download = _get_prefetch_executor().submit(_download_image, url)
+
+    try:
+        return download.result(timeout=BrowserSettings.IMAGE_DOWNLOAD_DEADLINE)
+    except FutureTimeoutError:
+        print(f"⚠️ Article image {url} not cached within {BrowserSettings.IMAGE_DOWNLOAD_DEADLINE}s")
+        return None